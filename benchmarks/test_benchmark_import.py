@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+
+def import_times(code: str) -> Dict[str, int]:
+    """Run ``code`` in a new interpreter with ``-X importtime``, and return the
+    cumulative import time of each module in microseconds."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        # Lines have the form: "import time: <self us> | <cumulative us> | <module>".
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, module = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            times[module.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import miter",
+        "import miter; miter.length([])",
+    ],
+)
+def test_import_time(benchmark, code):
+    times = benchmark.pedantic(import_times, args=(code,), rounds=10)
+
+    # Record the cumulative import time of the package, as reported by the
+    # interpreter, alongside the wall-clock time of interpreter startup.
+    benchmark.extra_info["miter_import_us"] = times["miter"]
+    if code == "import miter":
+        assert not {"typing", "enum", "miter._miter", "miter._python"} & times.keys()
+    elif "miter._miter" in times:
+        # With the C++ extension module, calling `length()` should not load the
+        # modules that only the pure Python implementation needs.
+        assert not {"typing", "miter._python"} & times.keys()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import itertools
+import tracemalloc
+
+import pytest
+
+import miter
+
+# Calling `iter()` on a native iterator allocates a small, constant amount of
+# memory in pybind11's call dispatch, but nothing proportional to the number of
+# elements or keys seen.
+MAX_ITER_ALLOCATED_BYTES = 256
+
+
+def allocated_bytes(func):
+    """Return the peak memory allocated while calling ``func``, in bytes."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+@pytest.mark.parametrize("n", [1_000, 100_000])
+@pytest.mark.parametrize("compact", [False, True])
+def test_iter_partially_consumed_unique(benchmark, n, compact):
+    # Calling `iter()` on a partially consumed iterator should return the same
+    # object, allocating no more than a small constant amount of memory,
+    # regardless of the number of keys seen so far.
+    it = miter.unique(range(n), compact=compact)
+    consumed = list(itertools.islice(it, n // 2))
+    assert len(consumed) == n // 2
+
+    result = benchmark(lambda: iter(iter(it)))
+
+    assert result is it
+    assert allocated_bytes(lambda: iter(iter(it))) <= MAX_ITER_ALLOCATED_BYTES
+    assert next(it) == n // 2
+
+
+@pytest.mark.parametrize("n", [1_000, 100_000])
+def test_iter_partially_consumed_indexes(benchmark, n):
+    it = miter.indexes([0] * n, 0)
+    consumed = list(itertools.islice(it, n // 2))
+    assert len(consumed) == n // 2
+
+    result = benchmark(lambda: iter(iter(it)))
+
+    assert result is it
+    assert allocated_bytes(lambda: iter(iter(it))) <= MAX_ITER_ALLOCATED_BYTES
+    assert next(it) == n // 2
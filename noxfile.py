@@ -30,7 +30,7 @@ def tests(session: nox.Session) -> None:
     """
     Run the unit and regular tests.
     """
-    session.install(".[test]")
+    session.install(".[test,arrays]")
     session.run("pytest", *session.posargs)
 
 
@@ -42,8 +42,8 @@ def benchmarks(session: nox.Session) -> None:
     session.install(".", ".[test]")
     session.run(
         "pytest",
-        "--benchmark-group-by=param:seq_type",
-        "benchmarks/test_seqtools_indexes.py",
+        "--benchmark-group-by=func",
+        "benchmarks/",
         *session.posargs,
     )
 
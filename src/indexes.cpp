@@ -46,7 +46,19 @@ public:
   IndexesIterator(SequenceType seq, py::object value)
       : IndexesIterator{seq, value, /*begin_index*/ 0, /*end_index*/ 0} {}
 
-  IndexesIterator iter() const { return *this; }
+  SequenceType sequence() const { return seq_; }
+  py::object value() const { return value_; }
+  size_t position() const { return curr_ - begin_; }
+  size_t end_position() const { return end_ - begin_; }
+
+  // Return zero if the iterator is known to be exhausted; otherwise, return
+  // NotImplemented, since the number of remaining matches is unknown.
+  py::object length_hint() const {
+    if (curr_ < end_) {
+      return py::reinterpret_borrow<py::object>(Py_NotImplemented);
+    }
+    return py::int_(0);
+  }
 
   size_t next() {
     if (curr_ < end_) {
@@ -80,25 +92,40 @@ py::object indexes(py::sequence seq, py::object value,
   }
   if (py::isinstance<py::tuple>(seq)) {
     return py::cast(
-        TupleIndexesIterator(py::list{seq}, value, start_index, end_index));
+        TupleIndexesIterator(py::tuple{seq}, value, start_index, end_index));
   }
   return py::cast(SequenceIndexesIterator{seq, value, start_index, end_index});
 }
 
+// Bind an IndexesIterator instantiation as a Python iterator type, which
+// returns itself from `__iter__` and supports `copy.copy()` and pickling.
+template <typename Iterator>
+void bind_indexes_iterator(py::module_ m, const char *name) {
+  py::class_<Iterator>(m, name)
+      .def("__iter__", [](py::object self) { return self; })
+      .def("__next__", &Iterator::next)
+      .def("__length_hint__", &Iterator::length_hint)
+      .def("__copy__", [](const Iterator &self) { return Iterator{self}; })
+      .def(py::pickle(
+          [](const Iterator &self) {
+            return py::make_tuple(self.sequence(), self.value(),
+                                  self.position(), self.end_position());
+          },
+          [](py::tuple state) {
+            using SequenceType = decltype(std::declval<Iterator>().sequence());
+            return Iterator{state[0].cast<SequenceType>(), state[1],
+                            state[2].cast<size_t>(), state[3].cast<size_t>()};
+          }));
+}
+
 void init_indexes(py::module_ m) {
   using namespace pybind11::literals; // For literal suffix `_a`.
 
-  py::class_<miter::SequenceIndexesIterator>(m, "_SequenceIndexesIterator")
-      .def("__iter__", &miter::SequenceIndexesIterator::iter)
-      .def("__next__", &miter::SequenceIndexesIterator::next);
-
-  py::class_<miter::ListIndexesIterator>(m, "_ListIndexesIterator")
-      .def("__iter__", &miter::ListIndexesIterator::iter)
-      .def("__next__", &miter::ListIndexesIterator::next);
-
-  py::class_<miter::TupleIndexesIterator>(m, "_TupleIndexesIterator")
-      .def("__iter__", &miter::TupleIndexesIterator::iter)
-      .def("__next__", &miter::TupleIndexesIterator::next);
+  bind_indexes_iterator<miter::SequenceIndexesIterator>(
+      m, "_SequenceIndexesIterator");
+  bind_indexes_iterator<miter::ListIndexesIterator>(m, "_ListIndexesIterator");
+  bind_indexes_iterator<miter::TupleIndexesIterator>(m,
+                                                     "_TupleIndexesIterator");
 
   m.def("indexes", &miter::indexes, "sequence"_a, "value"_a,
         "start"_a = std::nullopt, "end"_a = std::nullopt,
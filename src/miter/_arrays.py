@@ -0,0 +1,222 @@
+"""
+Array-aware engines for ``unique`` and ``all_unique``.
+
+One-dimensional NumPy arrays and PyArrow arrays with numeric or string values are
+deduplicated natively, instead of boxing each element into a Python object.  Neither
+NumPy nor PyArrow is imported by this module: an engine is used only for an argument
+whose type comes from one of those packages, which must therefore already be loaded.
+
+This module is imported whenever an implementation is selected, so it imports nothing
+at runtime.
+"""
+from __future__ import annotations
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any, Callable, Optional, TypeVar
+
+    F = TypeVar("F", bound=Callable[..., Any])
+
+# NumPy dtype kinds: boolean, signed and unsigned integer, floating point, complex,
+# unicode string, and byte string.
+_NUMPY_KINDS = frozenset("biufcUS")
+
+# Size of the first prefix checked by ``all_unique``; each following prefix is
+# ``_PREFIX_GROWTH`` times longer, so that duplicates near the start are found
+# without hashing or sorting the whole array, at a bounded extra cost.
+_INITIAL_PREFIX_SIZE = 1024
+_PREFIX_GROWTH = 4
+
+_UNIQUE_ARRAY_NOTE = """
+    For a one-dimensional NumPy or PyArrow array of numbers or strings, and no ``key``,
+    an array of the same kind is returned, containing the unique values in order of
+    first occurrence.  Elements are not converted to Python objects in this case.  NaN
+    values compare unequal to each other, so every NaN value is kept.
+"""
+
+_ALL_UNIQUE_ARRAY_NOTE = """
+    For a one-dimensional NumPy or PyArrow array of numbers or strings, and no ``key``,
+    the check is performed natively on successively longer prefixes of the array, so
+    that a duplicate near the start is found without examining the whole array.
+"""
+
+
+def _package(obj: object) -> str:
+    return type(obj).__module__.partition(".")[0]
+
+
+def _is_numpy_array(obj: Any) -> bool:
+    if _package(obj) != "numpy":
+        return False
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    if not isinstance(obj, np.ndarray):
+        return False
+    return obj.ndim == 1 and obj.dtype.kind in _NUMPY_KINDS
+
+
+def _is_arrow_array(obj: Any) -> bool:
+    if _package(obj) != "pyarrow":
+        return False
+    import pyarrow as pa  # pylint: disable=import-outside-toplevel
+
+    if not isinstance(obj, (pa.Array, pa.ChunkedArray)):
+        return False
+    return any(
+        is_type(obj.type)
+        for is_type in (
+            pa.types.is_boolean,
+            pa.types.is_integer,
+            pa.types.is_floating,
+            pa.types.is_string,
+            pa.types.is_large_string,
+            pa.types.is_binary,
+            pa.types.is_large_binary,
+        )
+    )
+
+
+def _numpy_first_indexes(arr: Any) -> Any:
+    """Return the sorted indexes of the first occurrence of each distinct value."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    # ``np.unique`` treats NaN values as equal to each other; keep every NaN.
+    if arr.dtype.kind in "fc":
+        is_nan = np.isnan(arr)
+        if is_nan.any():
+            positions = np.flatnonzero(~is_nan)
+            _, first_indexes = np.unique(arr[positions], return_index=True)
+            return np.sort(
+                np.concatenate([positions[first_indexes], np.flatnonzero(is_nan)])
+            )
+
+    _, first_indexes = np.unique(arr, return_index=True)
+    return np.sort(first_indexes)
+
+
+def _numpy_unique(arr: Any) -> Any:
+    # ``np.unique`` returns sorted values; restore the order of first occurrence.
+    return arr[_numpy_first_indexes(arr)]
+
+
+def _arrow_nan_mask(arr: Any) -> Optional[Any]:
+    """Return a boolean array that is true at the NaN values of ``arr``, or None if
+    ``arr`` contains no NaN values."""
+    import pyarrow as pa  # pylint: disable=import-outside-toplevel
+    import pyarrow.compute as pc  # pylint: disable=import-outside-toplevel
+
+    if not pa.types.is_floating(arr.type):
+        return None
+    is_nan = pc.fill_null(pc.is_nan(arr), False)
+    return is_nan if pc.any(is_nan).as_py() else None
+
+
+def _arrow_unique(arr: Any) -> Any:
+    import pyarrow as pa  # pylint: disable=import-outside-toplevel
+    import pyarrow.compute as pc  # pylint: disable=import-outside-toplevel
+
+    # The Arrow hash kernel returns values in order of first occurrence.
+    is_nan = _arrow_nan_mask(arr)
+    if is_nan is None:
+        return pc.unique(arr)
+
+    # The hash kernel treats NaN values as equal to each other; keep every NaN.
+    # Take the first occurrence of each other value, and every NaN, in order.
+    if isinstance(arr, pa.ChunkedArray):
+        arr = arr.combine_chunks()
+        is_nan = is_nan.combine_chunks()
+    values = pc.unique(arr.filter(pc.invert(is_nan)))
+    first_indexes = pc.index_in(values, value_set=arr, skip_nulls=False)
+    indexes = pa.concat_arrays(
+        [
+            first_indexes.cast(pa.int64()),
+            pc.indices_nonzero(is_nan).cast(pa.int64()),
+        ]
+    )
+    return arr.take(indexes.take(pc.sort_indices(indexes)))
+
+
+def _all_unique_by_prefix(arr: Any, count_distinct: Callable[[Any], int]) -> bool:
+    n: int = len(arr)  # pylint: disable=C0103
+    size = _INITIAL_PREFIX_SIZE
+    while True:
+        prefix = arr[:size]
+        if count_distinct(prefix) < len(prefix):
+            return False
+        if size >= n:
+            return True
+        size *= _PREFIX_GROWTH
+
+
+def _numpy_count_distinct(arr: Any) -> int:
+    return len(_numpy_first_indexes(arr))
+
+
+def _arrow_count_distinct(arr: Any) -> int:
+    import pyarrow.compute as pc  # pylint: disable=import-outside-toplevel
+
+    # Count null as a value, as ``None`` is for Python iterables, and each NaN
+    # as a distinct value.
+    is_nan = _arrow_nan_mask(arr)
+    if is_nan is None:
+        return int(pc.count_distinct(arr, mode="all").as_py())
+    non_nan = arr.filter(pc.invert(is_nan))
+    nan_count = len(arr) - len(non_nan)
+    return int(pc.count_distinct(non_nan, mode="all").as_py()) + nan_count
+
+
+def array_unique(arr: Any) -> Optional[Any]:
+    """Return the unique values of ``arr`` in order of first occurrence, as an array of
+    the same kind, or None if ``arr`` is not supported by an array engine."""
+    if _is_numpy_array(arr):
+        return _numpy_unique(arr)
+    if _is_arrow_array(arr):
+        return _arrow_unique(arr)
+    return None
+
+
+def array_all_unique(arr: Any) -> Optional[bool]:
+    """Return whether all values of ``arr`` are unique, or None if ``arr`` is not
+    supported by an array engine."""
+    if _is_numpy_array(arr):
+        return _all_unique_by_prefix(arr, _numpy_count_distinct)
+    if _is_arrow_array(arr):
+        return _all_unique_by_prefix(arr, _arrow_count_distinct)
+    return None
+
+
+def _update_wrapper(wrapper: Any, wrapped: Any, note: str) -> None:
+    """Copy the metadata of ``wrapped`` to ``wrapper``, appending ``note`` to its
+    docstring.  This avoids importing ``functools`` for ``functools.wraps()``."""
+    for name in ("__module__", "__name__", "__qualname__"):
+        setattr(wrapper, name, getattr(wrapped, name))
+    wrapper.__doc__ = (wrapped.__doc__ or "").rstrip() + "\n" + note
+    wrapper.__wrapped__ = wrapped
+
+
+def with_array_unique(unique: F) -> F:
+    """Wrap an implementation of ``unique`` to use an array engine when possible."""
+
+    def wrapper(iterable: Any, key: Any = None, compact: bool = False) -> Any:
+        if key is None:
+            result = array_unique(iterable)
+            if result is not None:
+                return result
+        return unique(iterable, key, compact)
+
+    _update_wrapper(wrapper, unique, _UNIQUE_ARRAY_NOTE)
+    return wrapper  # type: ignore[return-value]
+
+
+def with_array_all_unique(all_unique: F) -> F:
+    """Wrap an implementation of ``all_unique`` to use an array engine when possible."""
+
+    def wrapper(iterable: Any, key: Any = None) -> Any:
+        if key is None:
+            result = array_all_unique(iterable)
+            if result is not None:
+                return result
+        return all_unique(iterable, key)
+
+    _update_wrapper(wrapper, all_unique, _ALL_UNIQUE_ARRAY_NOTE)
+    return wrapper  # type: ignore[return-value]
@@ -0,0 +1,17 @@
+"""
+Enum indicating the selected ``miter`` implementation.
+"""
+from __future__ import annotations
+
+import enum
+
+
+class Impl(enum.Enum):
+    """Enum indicating a selected implementation."""
+
+    PYTHON_MODULE = "PYTHON_MODULE"
+    CPP_EXT_MODULE = "CPP_EXT_MODULE"
+
+
+PYTHON_MODULE = Impl.PYTHON_MODULE
+CPP_EXT_MODULE = Impl.CPP_EXT_MODULE
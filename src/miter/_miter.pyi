@@ -11,7 +11,9 @@ def all_unique(
     iterable: Iterable[T], key: Optional[Callable[[T], Hashable]] = None
 ) -> bool: ...
 def unique(
-    iterable: Iterable[T], key: Optional[Callable[[T], Hashable]] = None
+    iterable: Iterable[T],
+    key: Optional[Callable[[T], Hashable]] = None,
+    compact: bool = False,
 ) -> Iterable[T]: ...
 def indexes(
     seq: Sequence[T], value: T, start: Optional[int], end: Optional[int]
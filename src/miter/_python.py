@@ -0,0 +1,212 @@
+"""
+Pure Python implementation of the ``miter`` functions.
+
+This module is imported on first use of those functions, if the C++ extension
+module is not selected.
+"""
+from __future__ import annotations
+
+import array
+import collections
+import typing
+from typing import Callable, Iterable, Optional, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+# ITERABLES UTILITIES
+
+
+def length(iterable: Iterable[T]) -> int:
+    """Return the number of items in ``iterable``, by simply counting elements if necessary.
+
+        >>> length(i for i in range(10) if i % 2 == 0)
+        5
+
+    If necessary, the iterable is consumed.  For Sized arguments, ``len(iterable)`` is
+    returned without iterating over all elements.
+
+        >>> length(range(1_000_000))
+        1000000
+    """
+    try:
+        maybe_sized = typing.cast(collections.abc.Sized, iterable)
+        return len(maybe_sized)
+    except TypeError:
+        return sum(1 for _ in iterable)
+
+
+def all_equal(iterable: Iterable[T]) -> bool:
+    """Return whether all elements of ``iterable`` are equal to each other.
+
+        >>> all_equal("aaa")
+        True
+        >>> all_equal("aaab")
+        False
+
+    This function returns True for an empty iterable.
+
+        >>> all_equal([])
+        True
+    """
+    iterable = iter(iterable)
+    try:
+        ref_value = next(iterable)
+    except StopIteration:
+        return True
+    return all(elem == ref_value for elem in iterable)
+
+
+def all_unique(
+    iterable: Iterable[T], key: Optional[Callable[[T], typing.Hashable]] = None
+) -> bool:
+    """Return whether all elements of ``iterable`` are unique (i.e. no two elements are equal).
+
+        >>> all_unique([0, 1, 2])
+        True
+        >>> all_unique([0, 1, 2, 2])
+        False
+
+    If ``key`` is specified, it will be used to compare elements.
+
+        >>> all_unique(range(100), key=lambda i: i % 10)
+        False
+    """
+    if key is None:
+        observed_elems = set()
+        for elem in iterable:
+            if elem in observed_elems:
+                return False
+            observed_elems.add(elem)
+    else:
+        observed_keys = set()
+        for elem in iterable:
+            elem_key = key(elem)
+            if elem_key in observed_keys:
+                return False
+            observed_keys.add(elem_key)
+
+    return True
+
+
+def unique(
+    iterable: Iterable[T],
+    key: Optional[Callable[[T], typing.Hashable]] = None,
+    compact: bool = False,
+) -> Iterable[T]:
+    """Yield the unique elements in ``iterable``, according to ``key``, in order.
+
+        >>> list(unique("abracadabra"))
+        ['a', 'b', 'r', 'c', 'd']
+
+    If ``key`` is omitted, the identity function is used.  Values provided by ``iterable``
+    (or if a key is provided, the results of applying ``key`` to those values) must be hashable.
+
+        >>> list(unique("aAbBcCD", key=str.lower))
+        ['a', 'b', 'c', 'D']
+
+    This function uses auxiliary storage in both the Python and C++ implementations.
+
+    If ``compact`` is true and ``iterable`` is a sequence, the key objects are not retained.
+    Only the hash and index of each distinct key are stored, and ``key`` is re-applied to
+    earlier elements of the sequence whenever hashes match.  This reduces memory use when
+    ``key`` creates new objects, at the cost of additional calls to ``key``.
+
+        >>> list(unique(["ab", "AB", "c"], key=str.lower, compact=True))
+        ['ab', 'c']
+    """
+    if compact and isinstance(iterable, collections.abc.Sequence):
+        yield from _unique_compact(iterable, key)
+    elif key is None:
+        observed_elems = set()
+        for elem in iterable:
+            if elem not in observed_elems:
+                observed_elems.add(elem)
+                yield elem
+    else:
+        observed_keys = set()
+        for elem in iterable:
+            elem_key = key(elem)
+            if elem_key not in observed_keys:
+                observed_keys.add(elem_key)
+                yield elem
+
+
+def _unique_compact(
+    seq: Sequence[T], key: Optional[Callable[[T], typing.Hashable]]
+) -> Iterable[T]:
+    """Yield the unique elements in ``seq``, storing indexes rather than keys.
+
+    As in the C++ implementation, the hash and index of each distinct key are stored in
+    an open-addressing table, here a pair of flat arrays with load factor at most 2/3.
+    """
+
+    def key_func(elem: T) -> typing.Hashable:
+        return elem if key is None else key(elem)
+
+    hashes, indexes_ = _compact_table(8)
+    size = 0
+    for i, elem in enumerate(seq):
+        elem_key = key_func(elem)
+        elem_hash = hash(elem_key)
+        if 3 * (size + 1) > 2 * len(indexes_):
+            hashes, indexes_ = _grow_compact_table(hashes, indexes_)
+        mask = len(indexes_) - 1
+        slot = (elem_hash ^ (elem_hash >> 17)) & mask
+        while indexes_[slot] != -1:
+            if hashes[slot] == elem_hash and key_func(seq[indexes_[slot]]) == elem_key:
+                break
+            slot = (slot + 1) & mask
+        else:
+            hashes[slot] = elem_hash
+            indexes_[slot] = i
+            size += 1
+            yield elem
+
+
+def _compact_table(n: int) -> typing.Tuple[array.array[int], array.array[int]]:
+    """Return empty hash and index arrays with ``n`` slots; empty slots have index -1."""
+    return array.array("q", [0]) * n, array.array("q", [-1]) * n
+
+
+def _grow_compact_table(
+    hashes: array.array[int], indexes_: array.array[int]
+) -> typing.Tuple[array.array[int], array.array[int]]:
+    """Return a table with twice as many slots, containing the entries of the given one."""
+    new_hashes, new_indexes = _compact_table(2 * len(indexes_))
+    mask = len(new_indexes) - 1
+    for elem_hash, index in zip(hashes, indexes_):
+        if index != -1:
+            slot = (elem_hash ^ (elem_hash >> 17)) & mask
+            while new_indexes[slot] != -1:
+                slot = (slot + 1) & mask
+            new_hashes[slot] = elem_hash
+            new_indexes[slot] = index
+    return new_hashes, new_indexes
+
+
+# SEQUENCE UTILITIES
+
+
+def indexes(
+    seq: Sequence[T], value: T, start: Optional[int] = None, end: Optional[int] = None
+) -> Iterable[int]:
+    """Return an iterator over the indexes of all elements equal to ``value`` in ``sequence``.
+
+        >>> list(indexes("abracadabra", "a"))
+        [0, 3, 5, 7, 10]
+
+    If provided, the ``start`` and ``end`` parameters are interpreted as in slice notation
+    and are used to limit the search to a particular subsequence, as in the builtin
+    ``list.index()`` method.
+
+        >>> list(indexes([0, 1, 4, 4], 4, start=1, end=3))
+        [2]
+    """
+    n: int = len(seq)  # pylint: disable=C0103
+    # Clamp to range [-n, n).
+    start_clamped: int = max(-n, min(start or 0, n - 1))
+    assert (n == 0) or (-n <= start_clamped < n)
+    enum_start: int = start_clamped % n if n else 0
+    assert (n == 0) or (0 <= enum_start < n)
+    return (i for i, elem in enumerate(seq[start:end], enum_start) if elem == value)
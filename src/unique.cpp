@@ -1,5 +1,9 @@
 #include <algorithm> // std::min, std::max
+#include <cstdint>
+#include <limits>
 #include <optional>
+#include <utility> // std::swap
+#include <vector>
 
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h> // for std::optional
@@ -25,6 +29,10 @@ public:
   py::object operator()(const py::handle &obj) const {
     return py::reinterpret_borrow<py::object>(obj);
   }
+
+  // Key state, for pickling.
+  py::object state() const { return py::none(); }
+  static IdentityKey from_state(const py::object &) { return {}; }
 };
 
 struct CallableKey {
@@ -34,6 +42,12 @@ public:
   CallableKey(py::function func) : func_{func} {}
 
   py::object operator()(const py::handle &obj) const { return func_(obj); }
+
+  // Key state, for pickling.
+  py::object state() const { return func_; }
+  static CallableKey from_state(const py::object &state) {
+    return CallableKey{state.cast<py::function>()};
+  }
 };
 
 std::size_t length(py::iterable iterable) {
@@ -62,13 +76,53 @@ template <typename Key> class UniqueIterator {
   py::iterator end_;
   std::unordered_set<py::object, miter::ObjectHash, miter::ObjectEqual>
       unique_elements_;
+  // Whether `begin_` is an `itertools.tee` iterator, created by `copy()`.
+  bool teed_ = false;
 
 public:
   UniqueIterator(py::iterable it, Key key)
       : iterable_{it}, key_{std::move(key)}, begin_{std::begin(iterable_)},
         end_{std::end(iterable_)} {}
 
-  UniqueIterator iter() const { return *this; }
+  // Return an independent copy of this iterator.  The underlying iterator is
+  // split with `itertools.tee`, so both copies observe the remaining elements.
+  UniqueIterator copy() {
+    py::tuple iterators = py::module_::import("itertools").attr("tee")(begin_);
+    begin_ = iterators[0].cast<py::iterator>();
+    teed_ = true;
+    UniqueIterator result{*this};
+    result.begin_ = iterators[1].cast<py::iterator>();
+    return result;
+  }
+
+  // Return the iteration state as a tuple, for pickling.  After `copy()`, this
+  // reads all remaining elements of the source, and does not return for an
+  // unbounded source.
+  py::tuple state() const {
+    py::list seen;
+    for (const py::object &elem_key : unique_elements_) {
+      seen.append(elem_key);
+    }
+    py::object source = begin_;
+    if (teed_) {
+      // Pickling itertools objects is deprecated in Python 3.12 and removed in
+      // 3.14, so save the remaining elements of a tee iterator instead.  They
+      // are read from a copy of the tee, leaving `begin_` unchanged.
+      py::object remaining = py::module_::import("copy").attr("copy")(begin_);
+      source = py::iter(py::list(remaining));
+    }
+    return py::make_tuple(source, key_.state(), seen);
+  }
+
+  static UniqueIterator from_state(const py::tuple &state) {
+    UniqueIterator result{state[0].cast<py::iterable>(),
+                          Key::from_state(state[1])};
+    for (const py::handle &elem_key : state[2].cast<py::list>()) {
+      result.unique_elements_.insert(
+          py::reinterpret_borrow<py::object>(elem_key));
+    }
+    return result;
+  }
 
   // Return next unique element.
   py::object next() {
@@ -84,10 +138,173 @@ public:
   }
 };
 
+// Open-addressing hash set that stores only the hash and the source index of
+// each distinct key (16 bytes per slot), rather than owning the key objects.
+//
+// Because keys are not retained, equality between a new key and a stored entry
+// with the same hash is decided by a caller-supplied function that re-derives
+// the stored key from its index.
+class CompactSeenSet {
+  struct Entry {
+    std::uint64_t hash;
+    std::size_t index;
+  };
+
+  static constexpr std::size_t empty_index =
+      std::numeric_limits<std::size_t>::max();
+
+  std::vector<Entry> slots_;
+  std::size_t size_ = 0;
+
+  // Mix the hash bits, since Python hashes of small integers are the integers
+  // themselves, and linear probing on the low bits would cluster badly.
+  static std::size_t mix(std::uint64_t hash) {
+    hash *= 0x9E3779B97F4A7C15ULL;
+    return static_cast<std::size_t>(hash ^ (hash >> 32));
+  }
+
+  void grow() {
+    std::vector<Entry> old_slots(std::max<std::size_t>(8, 2 * slots_.size()),
+                                 Entry{0, empty_index});
+    std::swap(slots_, old_slots);
+    const std::size_t mask = slots_.size() - 1;
+    for (const Entry &entry : old_slots) {
+      if (entry.index != empty_index) {
+        std::size_t i = mix(entry.hash) & mask;
+        while (slots_[i].index != empty_index) {
+          i = (i + 1) & mask;
+        }
+        slots_[i] = entry;
+      }
+    }
+  }
+
+public:
+  // Return the stored indexes, in unspecified order.
+  std::vector<std::size_t> indexes() const {
+    std::vector<std::size_t> result;
+    result.reserve(size_);
+    for (const Entry &entry : slots_) {
+      if (entry.index != empty_index) {
+        result.push_back(entry.index);
+      }
+    }
+    return result;
+  }
+
+  // Insert the key with the given `hash` observed at `index`, unless an equal
+  // key is already present.  `is_equal(stored_index)` must return whether the
+  // key at `stored_index` equals the key being inserted.  Return whether the
+  // key was inserted.
+  template <typename Equal>
+  bool insert(std::uint64_t hash, std::size_t index, Equal &&is_equal) {
+    // Keep the load factor at most 2/3.
+    if (3 * (size_ + 1) > 2 * slots_.size()) {
+      grow();
+    }
+    const std::size_t mask = slots_.size() - 1;
+    for (std::size_t i = mix(hash) & mask;; i = (i + 1) & mask) {
+      const Entry entry = slots_[i];
+      if (entry.index == empty_index) {
+        slots_[i] = Entry{hash, index};
+        ++size_;
+        return true;
+      }
+      if (entry.hash == hash && is_equal(entry.index)) {
+        return false;
+      }
+    }
+  }
+};
+
+// Unique iterator over an indexable sequence, which does not keep key objects
+// alive.  Stored keys are re-derived from the sequence on hash matches, so the
+// key function may be called more than once for the same element.
+template <typename Key> class CompactUniqueIterator {
+  py::sequence seq_;
+  Key key_;
+  std::size_t index_ = 0;
+  CompactSeenSet seen_;
+
+public:
+  CompactUniqueIterator(py::sequence seq, Key key)
+      : seq_{seq}, key_{std::move(key)} {}
+
+  // Return zero if the iterator is known to be exhausted; otherwise, return
+  // NotImplemented, since the number of remaining unique elements is unknown.
+  py::object length_hint() const {
+    if (index_ < seq_.size()) {
+      return py::reinterpret_borrow<py::object>(Py_NotImplemented);
+    }
+    return py::int_(0);
+  }
+
+  CompactUniqueIterator copy() const { return *this; }
+
+  // Return the iteration state as a tuple, for pickling.  Hashes are not
+  // saved, since string hashes differ between interpreter processes.
+  py::tuple state() const {
+    py::list seen;
+    for (std::size_t i : seen_.indexes()) {
+      seen.append(i);
+    }
+    return py::make_tuple(seq_, key_.state(), index_, seen);
+  }
+
+  static CompactUniqueIterator from_state(const py::tuple &state) {
+    CompactUniqueIterator result{state[0].cast<py::sequence>(),
+                                 Key::from_state(state[1])};
+    result.index_ = state[2].cast<std::size_t>();
+    for (const py::handle &i : state[3].cast<py::list>()) {
+      const auto index = i.cast<std::size_t>();
+      py::object stored = result.seq_[index];
+      const auto hash =
+          static_cast<std::uint64_t>(py::hash(result.key_(stored)));
+      result.seen_.insert(hash, index, [](std::size_t) { return false; });
+    }
+    return result;
+  }
+
+  // Return next unique element.
+  py::object next() {
+    for (; index_ < seq_.size(); ++index_) {
+      py::object elem = seq_[index_];
+      py::object key_result = key_(elem);
+      const auto hash = static_cast<std::uint64_t>(py::hash(key_result));
+      const bool inserted =
+          seen_.insert(hash, index_, [this, &key_result](std::size_t i) {
+            py::object stored = seq_[i];
+            return key_(stored).equal(key_result);
+          });
+      if (inserted) {
+        ++index_;
+        return elem;
+      }
+    }
+    throw py::stop_iteration{};
+  }
+};
+
 using IdentityUniqueIterator = UniqueIterator<IdentityKey>;
 using KeyFunctionUniqueIterator = UniqueIterator<CallableKey>;
+using CompactIdentityUniqueIterator = CompactUniqueIterator<IdentityKey>;
+using CompactKeyFunctionUniqueIterator = CompactUniqueIterator<CallableKey>;
 
-py::object unique(py::iterable iterable, std::optional<py::function> key) {
+py::object unique(py::iterable iterable, std::optional<py::function> key,
+                  bool compact) {
+  if (compact) {
+    // `PySequence_Check` accepts any type with `__getitem__`, including
+    // mappings, so check for `collections.abc.Sequence` as the Python
+    // implementation does.
+    const py::object sequence_abc =
+        py::module_::import("collections.abc").attr("Sequence");
+    if (py::isinstance(iterable, sequence_abc)) {
+      py::sequence seq{iterable};
+      return key.has_value()
+                 ? py::cast(CompactKeyFunctionUniqueIterator{seq, *key})
+                 : py::cast(CompactIdentityUniqueIterator{seq, {}});
+    }
+  }
   return key.has_value() ? py::cast(KeyFunctionUniqueIterator{iterable, *key})
                          : py::cast(IdentityUniqueIterator{iterable, {}});
 };
@@ -113,6 +330,27 @@ bool all_unique(py::iterable iterable, std::optional<py::function> key) {
                                miter::IdentityKey{});
 }
 
+// Bind a unique iterator type as a Python iterator type, which returns itself
+// from `__iter__` and supports `copy.copy()` and pickling.
+template <typename Iterator>
+py::class_<Iterator> bind_unique_iterator(py::module_ m, const char *name) {
+  return py::class_<Iterator>(m, name)
+      .def("__iter__", [](py::object self) { return self; })
+      .def("__next__", &Iterator::next)
+      .def(
+          "__copy__", [](Iterator &self) { return self.copy(); },
+          R"pbdoc(
+Return an independent copy of this iterator.
+
+For an iterable that is not a sequence, the source is split with ``itertools.tee``.
+Pickling either iterator afterwards saves all remaining elements of the source, so it
+does not return for an unbounded source such as ``itertools.count()``.)pbdoc")
+      .def(py::pickle([](const Iterator &self) { return self.state(); },
+                      [](const py::tuple &state) {
+                        return Iterator::from_state(state);
+                      }));
+}
+
 void init_unique(py::module_ m) {
   using namespace pybind11::literals; // For literal suffix `_a`.
 
@@ -125,17 +363,26 @@ Return the number of elements in ``iterable``.  This may be useful for un-sized
   m.def("all_equal", &miter::all_equal, "iterable"_a, R"pbdoc(
 Return whether all elements of ``iterable`` are equal to each other.)pbdoc");
 
-  py::class_<miter::IdentityUniqueIterator>(m, "IdentityUniqueIterator")
-      .def("__iter__", &miter::IdentityUniqueIterator::iter)
-      .def("__next__", &miter::IdentityUniqueIterator::next);
-
-  py::class_<miter::KeyFunctionUniqueIterator>(m, "_KeyFunctionUniqueIterator")
-      .def("__iter__", &miter::KeyFunctionUniqueIterator::iter)
-      .def("__next__", &miter::KeyFunctionUniqueIterator::next);
+  bind_unique_iterator<miter::IdentityUniqueIterator>(
+      m, "IdentityUniqueIterator");
+  bind_unique_iterator<miter::KeyFunctionUniqueIterator>(
+      m, "_KeyFunctionUniqueIterator");
+  bind_unique_iterator<miter::CompactIdentityUniqueIterator>(
+      m, "_CompactIdentityUniqueIterator")
+      .def("__length_hint__",
+           &miter::CompactIdentityUniqueIterator::length_hint);
+  bind_unique_iterator<miter::CompactKeyFunctionUniqueIterator>(
+      m, "_CompactKeyFunctionUniqueIterator")
+      .def("__length_hint__",
+           &miter::CompactKeyFunctionUniqueIterator::length_hint);
 
   m.def("unique", &miter::unique, "iterable"_a, "key"_a = std::nullopt,
+        "compact"_a = false,
         R"pbdoc(
 Return an iterable over the unique elements in ``iterable``, according to ``key``, preserving order.
+
+If ``compact`` is true and ``iterable`` is a sequence, only the hash and index of each
+distinct key are stored, and keys are re-derived from the sequence to resolve hash matches.
 )pbdoc");
 
   m.def("all_unique", &miter::all_unique, "iterable"_a, "key"_a = std::nullopt,
@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import pytest
+
+import miter
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "requires_cpp(reason=...): skip unless the C++ extension module is selected",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if miter.is_implementation_cpp_extension_module():
+        return
+    for item in items:
+        marker = item.get_closest_marker("requires_cpp")
+        if marker is not None:
+            reason = marker.kwargs.get(
+                "reason", "Requires the C++ extension module iterator types."
+            )
+            item.add_marker(pytest.mark.skip(reason=reason))
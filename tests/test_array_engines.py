@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+import pytest
+
+import miter
+
+
+def test_unique_numpy_array():
+    np = pytest.importorskip("numpy")
+    arr = np.array([3, 1, 3, 2, 1, 0])
+    result = miter.unique(arr)
+    assert isinstance(result, np.ndarray)
+    assert result.tolist() == [3, 1, 2, 0]
+
+    strings = np.array(["b", "a", "b", "c"])
+    assert miter.unique(strings).tolist() == ["b", "a", "c"]
+
+
+def test_unique_numpy_array_with_key():
+    np = pytest.importorskip("numpy")
+    arr = np.array([3, 1, 4, 2])
+    # With a key, elements are compared by the generic implementation.
+    assert [int(x) for x in miter.unique(arr, key=lambda x: x % 2)] == [3, 4]
+
+
+def test_unique_numpy_object_array():
+    np = pytest.importorskip("numpy")
+    # Object arrays are handled by the generic implementation.
+    arr = np.array(["a", 1, "a"], dtype=object)
+    assert list(miter.unique(arr)) == ["a", 1]
+
+
+def test_all_unique_numpy_array():
+    np = pytest.importorskip("numpy")
+    assert miter.all_unique(np.array([], dtype=np.int64))
+    assert miter.all_unique(np.arange(10_000))
+    assert not miter.all_unique(np.array([0, 1, 0]))
+    # Duplicate located beyond the first prefix.
+    arr = np.arange(10_000)
+    arr[-1] = 0
+    assert not miter.all_unique(arr)
+
+
+def test_unique_arrow_array():
+    pa = pytest.importorskip("pyarrow")
+    arr = pa.array([3, 1, 3, None, 2, None])
+    assert miter.unique(arr).to_pylist() == [3, 1, None, 2]
+
+    chunked = pa.chunked_array([["b", "a"], ["b", "c"]])
+    assert miter.unique(chunked).to_pylist() == ["b", "a", "c"]
+
+
+def test_all_unique_arrow_array():
+    pa = pytest.importorskip("pyarrow")
+    assert miter.all_unique(pa.array([0, 1, 2, None]))
+    assert not miter.all_unique(pa.array([0, None, 2, None]))
+    assert not miter.all_unique(pa.chunked_array([list(range(5_000)), [4_999]]))
+
+
+def test_numpy_nan_values_are_distinct():
+    # Each NaN is distinct, as for the elements of other iterables.
+    np = pytest.importorskip("numpy")
+    nan = float("nan")
+    arr = np.array([nan, 1.0, nan, 1.0, 2.0])
+    assert miter.all_unique(np.array([nan, nan]))
+    assert miter.all_unique(np.array([nan, nan]).tolist())
+    assert not miter.all_unique(arr)
+    result = miter.unique(arr)
+    assert np.isnan(result[[0, 2]]).all()
+    assert result[[1, 3]].tolist() == [1.0, 2.0]
+    assert len(result) == 4
+
+
+def test_arrow_nan_values_are_distinct():
+    pa = pytest.importorskip("pyarrow")
+    nan = float("nan")
+    assert miter.all_unique(pa.array([nan, nan]))
+    assert not miter.all_unique(pa.array([nan, 1.0, 1.0]))
+    assert not miter.all_unique(pa.array([nan, None, None]))
+
+    result = miter.unique(pa.array([nan, 1.0, None, nan, 1.0, None, 2.0]))
+    assert isinstance(result, pa.Array)
+    values = result.to_pylist()
+    assert len(values) == 5
+    assert values[0] != values[0] and values[3] != values[3]
+    assert values[1:3] + values[4:] == [1.0, None, 2.0]
+
+    chunked = pa.chunked_array([[nan, 1.0], [1.0, nan]])
+    result = miter.unique(chunked)
+    assert isinstance(result, pa.Array)
+    assert len(result) == 3
+
+
+def test_wrapper_docstrings():
+    assert "NumPy" in miter.unique.__doc__
+    assert "NumPy" in miter.all_unique.__doc__
+    assert miter.unique.__name__ == "unique"
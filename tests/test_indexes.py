@@ -2,8 +2,11 @@ from __future__ import annotations
 
 import array
 import collections
+import copy
 import functools
 import itertools
+import operator
+import pickle
 from typing import List
 
 import hypothesis
@@ -136,3 +139,37 @@ def test_indexes_with_start_end(seq):
             expected_ixs = []
 
         assert list(miter.indexes(seq, value, start=start, end=end)) == expected_ixs
+
+
+def test_indexes_iter_returns_self():
+    it = miter.indexes("abracadabra", "a")
+    assert next(it) == 0
+    assert iter(it) is it
+    assert list(iter(iter(it))) == [3, 5, 7, 10]
+
+
+@pytest.mark.requires_cpp
+@pytest.mark.parametrize(
+    "type_",
+    [
+        tuple,
+        list,
+        pytest.param(functools.partial(array.array, "i"), id="array.array"),
+    ],
+)
+def test_indexes_copy_and_pickle(type_):
+    seq = type_(i % 3 for i in range(10))
+    it = miter.indexes(seq, 0, start=1)
+    assert next(it) == 3
+    it_copy = copy.copy(it)
+    restored = pickle.loads(pickle.dumps(it))
+    assert list(it) == [6, 9]
+    assert list(it_copy) == [6, 9]
+    assert list(restored) == [6, 9]
+
+
+@pytest.mark.requires_cpp(reason="Generators do not define __length_hint__.")
+def test_indexes_length_hint():
+    it = miter.indexes([0, 1, 0], 0)
+    assert list(it) == [0, 2]
+    assert operator.length_hint(it, -1) == 0
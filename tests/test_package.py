@@ -1,7 +1,26 @@
 from __future__ import annotations
 
+import subprocess
+import sys
+
 import miter
 
 
 def test_version():
     assert miter.__version__
+
+
+def test_import_is_lazy():
+    # Importing the package should not select (and load) an implementation.
+    code = (
+        "import sys, miter; "
+        "print(sorted(m for m in sys.modules if m.startswith('miter.')))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "['miter._version']"
+
+
+def test_dir():
+    assert {"length", "unique", "MITER_IMPL"} <= set(dir(miter))
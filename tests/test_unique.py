@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+import collections
+import copy
+import gc
 import itertools
+import pickle
 import string
+import weakref
 
 import hypothesis
 import pytest
@@ -48,3 +53,126 @@ def test_unique_with_key_function(s):
     assert concat(miter.unique(s + s.lower(), key=str.upper)) == s
     assert concat(miter.unique(s + s.upper(), key=str.lower)) == s
     assert concat(miter.unique(s + s.upper(), key=str.upper)) == s
+
+
+def test_unique_compact():
+    unique = miter.unique
+    assert list(unique([], compact=True)) == []
+    assert list(unique([0, 0, 0], compact=True)) == [0]
+    assert list(unique("abracadabra", compact=True)) == ["a", "b", "r", "c", "d"]
+    assert list(unique("aAbBcCD", key=str.lower, compact=True)) == ["a", "b", "c", "D"]
+    # Non-sequence iterables are accepted, and use ordinary storage.
+    assert list(unique(iter("abracadabra"), compact=True)) == ["a", "b", "r", "c", "d"]
+
+
+def test_unique_compact_mapping():
+    # Mappings are not sequences, so their keys must not be looked up by position.
+    class Mapping(collections.abc.Mapping):
+        def __init__(self, data):
+            self._data = data
+
+        def __getitem__(self, key):
+            return self._data[key]
+
+        def __iter__(self):
+            return iter(self._data)
+
+        def __len__(self):
+            return len(self._data)
+
+    assert list(miter.unique(Mapping({"x": 1, "y": 2}), compact=True)) == ["x", "y"]
+    assert list(miter.unique(Mapping({0: "a", 1: "b"}), compact=True)) == [0, 1]
+    assert list(miter.unique({0: "a", 1: "b"}, compact=True)) == [0, 1]
+
+
+class CountedKey:
+    """Key type that records its live instances."""
+
+    instances: weakref.WeakSet[CountedKey] = weakref.WeakSet()
+
+    def __init__(self, value):
+        self.value = value
+        CountedKey.instances.add(self)
+
+    def __eq__(self, other):
+        return self.value == other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_unique_compact_does_not_retain_keys(compact):
+    it = miter.unique(range(1_000), key=CountedKey, compact=compact)
+    assert len(list(itertools.islice(it, 500))) == 500
+    gc.collect()
+    live_keys = len(CountedKey.instances)
+    if compact:
+        assert live_keys <= 1
+    else:
+        assert live_keys >= 500
+    del it
+
+
+def test_unique_compact_hash_collisions():
+    # Distinct integers -1 and -2 have the same hash, so equality must be
+    # resolved by re-deriving the stored key.
+    assert hash(-1) == hash(-2)
+    assert list(miter.unique([-1, -2, -1, -2], compact=True)) == [-1, -2]
+    assert list(miter.unique(range(-3, 3), key=abs, compact=True)) == [-3, -2, -1, 0]
+
+
+@hypothesis.given(st.lists(st.integers(min_value=0, max_value=20)))
+def test_unique_compact_matches_unique(seq):
+    assert list(miter.unique(seq, compact=True)) == list(miter.unique(seq))
+    assert list(miter.unique(seq, key=lambda i: i % 7, compact=True)) == list(
+        miter.unique(seq, key=lambda i: i % 7)
+    )
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_unique_iter_returns_self(compact):
+    it = miter.unique("abracadabra", compact=compact)
+    assert next(it) == "a"
+    assert iter(it) is it
+    assert list(iter(iter(it))) == ["b", "r", "c", "d"]
+    assert list(it) == []
+
+
+@pytest.mark.requires_cpp
+@pytest.mark.parametrize("compact", [False, True])
+@pytest.mark.parametrize("key", [None, str.lower])
+def test_unique_copy(key, compact):
+    it = miter.unique("abBAcCa", key=key, compact=compact)
+    assert next(it) == "a"
+    it_copy = copy.copy(it)
+    assert it_copy is not it
+    expected = ["b", "c"] if key else ["b", "B", "A", "c", "C"]
+    assert list(it) == expected
+    assert list(it_copy) == expected
+
+
+@pytest.mark.requires_cpp
+@pytest.mark.parametrize("compact", [False, True])
+@pytest.mark.parametrize("key", [None, str.lower])
+def test_unique_pickle(key, compact):
+    it = miter.unique("abBAcCa", key=key, compact=compact)
+    assert next(it) == "a"
+    restored = pickle.loads(pickle.dumps(it))
+    expected = ["b", "c"] if key else ["b", "B", "A", "c", "C"]
+    assert list(restored) == expected
+    assert list(it) == expected
+
+
+@pytest.mark.requires_cpp
+@pytest.mark.parametrize("compact", [False, True])
+def test_unique_copy_then_pickle(compact):
+    it = miter.unique("abBAcCa", key=str.lower, compact=compact)
+    assert next(it) == "a"
+    it_copy = copy.copy(it)
+    restored = pickle.loads(pickle.dumps(it))
+    restored_copy = pickle.loads(pickle.dumps(it_copy))
+    assert list(it) == ["b", "c"]
+    assert list(restored) == ["b", "c"]
+    assert list(restored_copy) == ["b", "c"]
+    assert list(it_copy) == ["b", "c"]